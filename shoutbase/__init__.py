@@ -0,0 +1,14 @@
+"""
+Shoutbase API client for python3
+
+Usage:
+    >>> from shoutbase import ShoutbaseReport
+    >>> user_params = {'username': 'me', 'password': '123'}
+    >>> report = ShoutbaseReport(user_params)
+    >>> report.run(report_params)
+
+"""
+from .client import ShoutbaseClient
+from .reports import ShoutbaseReport
+
+__all__ = ['ShoutbaseClient', 'ShoutbaseReport']
@@ -0,0 +1,366 @@
+"""
+Shoutbase API client
+
+pandas is only imported once a report is actually formatted, so callers
+that just compose report URLs do not pay for it.
+"""
+import calendar
+import datetime
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO, StringIO
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from urllib.parse import quote_plus, urlencode  # for Python 2.x
+except ImportError:
+    from urllib import quote_plus, urlencode  # for Python 3.x
+
+
+@lru_cache(maxsize=None)
+def _csv_engine():
+    """pyarrow parses CSV multithreaded when it is installed
+    """
+    if importlib.util.find_spec('pyarrow') is None:
+        return 'c'
+    return 'pyarrow'
+
+
+@lru_cache(maxsize=256)
+def _to_epoch(date):
+    """date format conversion, memoized per date string
+
+    Dates are 'YYYY-MM-DD' and taken as midnight UTC.
+    """
+    try:
+        year, month, day = [int(part) for part in date.split('-')]
+    except ValueError:
+        raise ValueError("date %r does not match format 'YYYY-MM-DD'" % date)
+    # datetime.date validates the fields; timegm interprets them as UTC
+    midnight = datetime.date(year, month, day)
+    epoch = calendar.timegm(midnight.timetuple())
+    return str(epoch * 1000)
+
+class ShoutbaseClient(object):
+    """
+    Base Helper class for the ShoutBase API
+    """
+    def __init__(self, user_params=None):
+        """
+        """
+        if user_params is None:
+            raise Exception("user params dict not specified.")
+
+        # API params
+        self.hostname = 'https://api.shoutbase.com'
+        self.max_workers = 8  # concurrent id lookups
+        # user params
+        self.username = user_params['username']
+        self.password = user_params['password']
+        self.report_url = None
+        self.report_data = None
+        # buffer the export body in report_data instead of streaming it,
+        # so format_report() can re-format the last export
+        self.keep_report_data = False
+
+        # name --> id lookup caches
+        self._tag_cache = {}
+        self._team_cache = {}
+        self._url_cache = {}
+
+        # persistent session: reuse pooled connections across requests
+        self.session = requests.Session()
+        self.session.auth = (self.username, self.password)
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=max(16, self.max_workers),
+                              max_retries=3)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def refresh(self):
+        """Forget cached report URLs so ids are resolved again
+        """
+        self._url_cache.clear()
+
+    def close(self):
+        """Close the underlying HTTP session
+        """
+        self.session.close()
+
+    def run(self, report_params=None, chunksize=None, usecols=None):
+        """
+        Run the report:
+            1) Get report URL if needed
+            2) Fetch data using API
+            3) TODO: create report
+
+        With chunksize, returns an iterator of dataframes instead.
+        usecols limits the (raw) export columns that are parsed.
+        """
+        if report_params is not None:
+            self.compose_report_url(report_params)
+        if self.report_url is None:
+            return Exception("Report not defined.")
+
+        self.report_data = None
+        if self.keep_report_data:
+            response = self.session.get(self.report_url)
+            response.raise_for_status()
+            self.report_data = response.content
+            return self.format_report(chunksize=chunksize, usecols=usecols)
+
+        return self._export(self.report_url, chunksize=chunksize,
+                            usecols=usecols)
+
+    def _export(self, url, chunksize=None, usecols=None):
+        """fetch the export at url and format it
+        """
+        # stream the CSV body straight into the parser
+        response = self.session.get(url, stream=True)
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        if chunksize is not None:
+            return self._iter_report_chunks(response, chunksize, usecols)
+        with response:
+            report_df = self.format_report(report_file=response.raw,
+                                           usecols=usecols)
+        return report_df
+
+    def _iter_report_chunks(self, response, chunksize, usecols=None):
+        """yield formatted chunks, keeping the response open until done
+        """
+        with response:
+            for chunk in self.format_report(report_file=response.raw,
+                                            chunksize=chunksize,
+                                            usecols=usecols):
+                yield chunk
+
+    def format_report(self,
+                      pythonic_colnames=True,
+                      short_usernames=True,
+                      report_file=None,
+                      chunksize=None,
+                      usecols=None,
+                      ):
+        """
+        Format report:
+            * Convert raw report data to a dataframe
+            * Apply transformations applicable to all reports
+
+        report_file is a file-like CSV source; defaults to report_data,
+        which run() only fills in (as raw bytes) when keep_report_data is
+        set.
+        With chunksize, returns an iterator of formatted dataframes.
+        usecols limits the (raw) export columns that are parsed.
+        """
+        import pandas as pd
+
+        if report_file is None:
+            if not self.report_data:
+                raise Exception("No report data: set keep_report_data "
+                                "before run() to re-format an export.")
+            if isinstance(self.report_data, bytes):
+                report_file = BytesIO(self.report_data)
+            else:
+                report_file = StringIO(self.report_data)
+
+        options = {
+            'pythonic_colnames': pythonic_colnames,
+            'short_usernames': short_usernames,
+        }
+        # explicit dtypes, so an export with no rows still yields string
+        # columns (pyarrow would type them as all-null floats)
+        dtype = dict.fromkeys(['startAt', 'endAt', 'tagNames', 'teamNames',
+                               'description', 'creator'], str)
+        dtype['durationHours'] = 'float64'
+        read_options = {
+            'dtype': dtype,
+            'encoding': 'utf-8',  # bytes are decoded once, in the parser
+            'usecols': usecols,
+        }
+        if chunksize is None:
+            report_df = pd.read_csv(report_file, engine=_csv_engine(),
+                                    **read_options)
+            return self._format_frame(report_df, **options)
+
+        reader = pd.read_csv(report_file, chunksize=chunksize, **read_options)
+        return (self._format_frame(chunk, **options) for chunk in reader)
+
+    @staticmethod
+    def _format_frame(report_df, pythonic_colnames, short_usernames):
+        """Apply report transformations to a single dataframe
+        """
+        import pandas as pd
+
+        # deal with datetime format
+        tsformat = '%Y-%m-%d %H:%M:%S +%f UTC'
+        for col in ['startAt', 'endAt']:
+            if col in report_df:
+                report_df[col] = pd.to_datetime(report_df[col],
+                                                format=tsformat, cache=True)
+
+        # truncate usernames
+        if short_usernames and 'creator' in report_df:
+            report_df['creator'] = report_df['creator']\
+                .str.split('@', n=1).str[0]
+
+        # repeated labels as categoricals: smaller frames, faster groupby
+        for col in ['creator', 'tagNames', 'teamNames']:
+            if col in report_df:
+                report_df[col] = report_df[col].astype('category')
+
+        # renaming columns
+        rename_map = {
+            'startAt': 'start_time',
+            'endAt': 'end_time',
+            'durationHours': 'duration_hours',
+            'tagNames': 'tags',
+            'teamNames': 'teams',
+            'description': 'description',
+            'creator': 'person',
+        }
+        if pythonic_colnames:
+            report_df.columns = [rename_map.get(col, col)
+                                 for col in report_df.columns]
+
+        return report_df
+
+    def compose_report_url(self, report_params):
+        """Define report parameters, do not run report
+        """
+        self.report_url = self._report_url(report_params)
+        return self.report_url
+
+    def _report_url(self, report_params):
+        """return the export URL for report_params, without saving it
+        """
+        # reuse URL composed for identical params
+        cache_key = self._params_key(report_params)
+        if cache_key in self._url_cache:
+            return self._url_cache[cache_key]
+
+        team_id, tag_ids = self._resolve_ids(report_params)
+        url = self._export_url(report_params, team_id, tag_ids)
+
+        # only cache fully resolved URLs, so failed lookups are retried
+        tag_list = report_params.get('tag_list', [])
+        if team_id and len(tag_ids) == len(tag_list):
+            self._url_cache[cache_key] = url
+        return url
+
+    def _resolve_ids(self, report_params):
+        """return (team_id, tag_ids) for report_params
+
+        Tag names that do not resolve are left out of tag_ids.
+        """
+        # TODO: run some checks on input
+        team_name = report_params['team_name']
+        tag_list = report_params.get('tag_list', [])
+
+        # conversions, looked up concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            team_future = executor.submit(self._teamid_from_name, team_name)
+            tag_ids = [tag_id for tag_id
+                       in self._resolve_tag_ids(tag_list, executor) if tag_id]
+            team_id = team_future.result()
+        return team_id, tag_ids
+
+    def _export_url(self, report_params, team_id, tag_ids):
+        """build the export URL for report_params from resolved ids
+        """
+        tag_filter_type = report_params.get('tag_filter_type', None)
+
+        # Construct report request url, leaving out unset filters
+        query = [
+            ('teamId', team_id),
+            ('closedOnly', 'false'),
+            ('startsBy', self.to_epoch(report_params['start_date'])),
+            ('endsBy', self.to_epoch(report_params['end_date'])),
+        ]
+        if tag_ids:
+            query.append(('tagIds', ",".join(tag_ids)))
+        if tag_filter_type:
+            query.append(('tagFilterType', tag_filter_type))
+        return self.hostname + '/v1/export/timerecords?' + urlencode(query)
+
+    """Util Methods
+    """
+    @staticmethod
+    def _params_key(report_params):
+        """hashable key identifying a set of report params
+        """
+        return (
+            report_params['team_name'],
+            report_params['start_date'],
+            report_params['end_date'],
+            tuple(sorted(report_params.get('tag_list', []))),
+            report_params.get('tag_filter_type', None),
+        )
+
+    def _resolve_tag_ids(self, tag_names, executor):
+        """return tag ids given tag names, in a single request if possible
+        """
+        missing = [name for name in tag_names if name not in self._tag_cache]
+        if missing:
+            url = (self.hostname + '/v1/tags?name=' +
+                   quote_plus(",".join(missing)))
+            resp = self.session.get(url)
+            if resp.ok:
+                # names absent from the bulk response simply don't resolve
+                for tag in resp.json()["data"]:
+                    if tag.get("name") in missing:
+                        self._tag_cache[tag["name"]] = tag["id"]
+            else:
+                # bulk lookup unsupported: fall back to one query per name
+                list(executor.map(self._tagid_from_name, missing))
+
+        return [self._tag_cache.get(name, "") for name in tag_names]
+
+    def _tagid_from_name(self, tag_name):
+        """return tag id given tag name
+        """
+        if tag_name in self._tag_cache:
+            return self._tag_cache[tag_name]
+
+        url = self.hostname + '/v1/tags?name=' + quote_plus(tag_name)
+
+        # fetch data
+        resp = self.session.get(url)
+        data = resp.json()["data"]
+
+        # get tag id
+        tag_id = data[0]["id"] if data else ""
+        if tag_id:
+            self._tag_cache[tag_name] = tag_id
+        return tag_id
+
+    def _teamid_from_name(self, name):
+        """return team id given team name
+        """
+        if name in self._team_cache:
+            return self._team_cache[name]
+
+        team_url = self.hostname + '/v1/teams?name=' + quote_plus(name)
+        team_response = self.session.get(team_url)
+        team_json = team_response.json()
+        if team_json["data"]:
+            team_id = team_json["data"][0]["id"]
+        else:
+            team_id = ""
+        if team_id:
+            self._team_cache[name] = team_id
+        return team_id
+
+    @staticmethod
+    def to_epoch(date):
+        """date format conversion
+        """
+        return _to_epoch(date)
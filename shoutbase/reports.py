@@ -0,0 +1,175 @@
+"""
+Standard reports built on the Shoutbase API client
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import ShoutbaseClient
+
+
+class ShoutbaseReport(ShoutbaseClient):
+    """Extends base client with standard reports
+    """
+    # rows parsed at a time for aggregate reports; None loads (and caches)
+    # the whole export instead
+    chunksize = None
+
+    # export columns read by the standard reports; cached exports load all
+    # of them so one download serves every report
+    report_columns = ['startAt', 'durationHours', 'teamNames', 'creator']
+
+    def __init__(self, user_params=None):
+        super(ShoutbaseReport, self).__init__(user_params)
+        self._df_cache = {}
+
+    def fetch(self, report_params, usecols=None):
+        """Fetch the formatted export, reusing earlier downloads
+
+        usecols limits the export columns parsed; a cached export is
+        reused whenever it already holds them. The frame returned is a
+        shallow copy, so adding, dropping or filtering columns does not
+        change the cached export.
+        """
+        report_df = self._cached_export(report_params, usecols)
+        if report_df is None:
+            report_df = self.run(report_params=report_params, usecols=usecols)
+            columns = None if usecols is None else frozenset(usecols)
+            key = self._params_key(report_params)
+            self._df_cache[key] = (columns, report_df)
+        return report_df.copy(deep=False)
+
+    def _cached_export(self, report_params, usecols):
+        """Return the cached export if it holds usecols, else None"""
+        key = self._params_key(report_params)
+        if key not in self._df_cache:
+            return None
+        columns, report_df = self._df_cache[key]
+        if columns is None:
+            return report_df
+        if usecols is not None and columns >= set(usecols):
+            return report_df
+        return None
+
+    def refresh(self):
+        """Forget cached exports so the next report downloads again"""
+        super(ShoutbaseReport, self).refresh()
+        self._df_cache.clear()
+
+    def total_hours_by_user(self, report_params):
+        """Total hours reported per user"""
+        return self._sum_hours(report_params, index='person',
+                               usecols=['creator', 'durationHours'])
+
+    def summary_by_week(self, report_params):
+        """For each week, summarize hours reported per user"""
+        import pandas as pd
+
+        raw_df = self._cached_export(report_params, self.report_columns)
+        if raw_df is None:
+            # fetch each week's export concurrently; tag/team ids are
+            # resolved once and only the dates change from week to week
+            weeks = self._split_by_week(report_params)
+            team_id, tag_ids = self._resolve_ids(report_params)
+            urls = [self._export_url(week_params, team_id, tag_ids)
+                    for week_params, _, _ in weeks]
+            first_days = [first_day for _, first_day, _ in weeks]
+            next_weeks = [next_week for _, _, next_week in weeks]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                week_dfs = executor.map(self._export_week,
+                                        urls, first_days, next_weeks)
+                raw_df = pd.concat(list(week_dfs), ignore_index=True)
+
+            # the weeks add up to the whole export; keep it for other reports
+            key = self._params_key(report_params)
+            self._df_cache[key] = (frozenset(self.report_columns), raw_df)
+
+        # create time series
+        raw_ts = raw_df.set_index('start_time')[['duration_hours']]
+
+        # resample to business week starting Mondays
+        report_ts = raw_ts.resample('W-MON', ).sum()
+        report_ts.index.name = 'week_starting_date'
+
+        return report_ts
+
+    def _export_week(self, url, first_day, next_week):
+        """Fetch one week's export, keeping records that start in the week"""
+        week_df = self._export(url, usecols=self.report_columns)
+        if first_day is not None:
+            week_df = week_df[week_df['start_time'] >= first_day]
+        if next_week is not None:
+            week_df = week_df[week_df['start_time'] < next_week]
+        return week_df
+
+    @staticmethod
+    def _split_by_week(report_params):
+        """Split the report date range at each Monday
+
+        Returns (week_params, first_day, next_week) per week. Weeks other
+        than the last are fetched one day past their end, so records
+        running over the Monday midnight are returned whichever way the
+        API applies startsBy/endsBy; each record is then kept only in the
+        week its start_time falls in, between first_day and next_week
+        (None at the ends of the range, where nothing is trimmed).
+        """
+        import pandas as pd
+
+        start = pd.Timestamp(report_params['start_date'])
+        end = pd.Timestamp(report_params['end_date'])
+        mondays = pd.date_range(start, end, freq='W-MON')
+        edges = [start] + [day for day in mondays if start < day < end] + [end]
+
+        weeks = []
+        last = len(edges) - 2
+        for i, (week_start, week_end) in enumerate(zip(edges[:-1], edges[1:])):
+            fetch_end = week_end
+            if i < last:
+                fetch_end = week_end + pd.Timedelta(days=1)
+            week_params = dict(report_params,
+                               start_date=week_start.strftime('%Y-%m-%d'),
+                               end_date=fetch_end.strftime('%Y-%m-%d'))
+            weeks.append((
+                week_params,
+                week_start if i > 0 else None,
+                week_end if i < last else None,
+            ))
+        return weeks
+
+    def last_report_date(self, report_params):
+        """For each user, provide the last date hours were reported"""
+        pass
+
+    def hours_by_project(self, report_params):
+        """Summarize the hours spent on each project"""
+        report_df = self.hours_by_team(report_params)
+
+        # rename team --> project
+        report_df.index.name = 'project'
+        return report_df
+
+    def hours_by_team(self, report_params):
+        """Summarize the hours spent by each team"""
+        return self._sum_hours(report_params, index='teams',
+                               usecols=['teamNames', 'durationHours'])
+
+    def _sum_hours(self, report_params, index, usecols):
+        """Sum duration_hours by index, folding chunks when chunksize is set"""
+        if self.chunksize is None:
+            chunks = [self.fetch(report_params, usecols=self.report_columns)]
+        else:
+            chunks = self.run(report_params=report_params,
+                              chunksize=self.chunksize, usecols=usecols)
+
+        hours = None
+        for chunk in chunks:
+            chunk_hours = chunk.groupby(index, observed=True, sort=False)\
+                ['duration_hours'].sum()
+            if hours is None:
+                hours = chunk_hours
+            else:
+                hours = hours.add(chunk_hours, fill_value=0)
+
+        if hours is None:
+            import pandas as pd
+            hours = pd.Series(name='duration_hours', dtype=float)
+            hours.index.name = index
+        return hours.to_frame()
@@ -0,0 +1,116 @@
+"""
+Fake Shoutbase API for the tests
+"""
+import io
+import os
+import sys
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shoutbase.client  # noqa: E402
+from shoutbase import ShoutbaseReport  # noqa: E402
+
+HEADER = 'startAt,endAt,durationHours,tagNames,teamNames,description,creator'
+TSFORMAT = '%Y-%m-%d %H:%M:%S +0000 UTC'
+
+
+def to_ms(timestamp):
+    """epoch milliseconds of a naive UTC timestamp string"""
+    import pandas as pd
+    return int(pd.Timestamp(timestamp).value // 10 ** 6)
+
+
+class FakeResponse(object):
+    def __init__(self, json_data=None, body=b'', status_code=200):
+        self._json = json_data
+        self.content = body
+        self.raw = io.BytesIO(body)
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise Exception("HTTP %s" % self.status_code)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class FakeSession(object):
+    """Serves teams, tags and time record exports from memory
+
+    records are (start, end, hours, creator, team) tuples. mode is how
+    the export applies startsBy/endsBy: by record start, by containment,
+    or by overlap. Without bulk_tags, comma-joined tag names get a 404.
+    """
+    def __init__(self, records=(), tags=None, teams=None, mode='start',
+                 bulk_tags=True):
+        self.records = list(records)
+        self.tags = tags if tags is not None else {}
+        self.teams = teams if teams is not None else {'T': 'team1'}
+        self.mode = mode
+        self.bulk_tags = bulk_tags
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        if parsed.path == '/v1/teams':
+            name = query['name'][0]
+            data = [{'id': self.teams[name]}] if name in self.teams else []
+            return FakeResponse({'data': data})
+        if parsed.path == '/v1/tags':
+            names = query['name'][0].split(',')
+            if len(names) > 1 and not self.bulk_tags:
+                return FakeResponse(status_code=404)
+            data = [{'id': self.tags[name], 'name': name}
+                    for name in names if name in self.tags]
+            return FakeResponse({'data': data})
+        return FakeResponse(body=self._export(int(query['startsBy'][0]),
+                                              int(query['endsBy'][0])))
+
+    def _export(self, starts_by, ends_by):
+        rows = [HEADER]
+        for start, end, hours, creator, team in self.records:
+            start_ms, end_ms = to_ms(start), to_ms(end)
+            selected = {
+                'start': starts_by <= start_ms < ends_by,
+                'contained': starts_by <= start_ms and end_ms <= ends_by,
+                'overlap': start_ms < ends_by and end_ms > starts_by,
+            }[self.mode]
+            if selected:
+                rows.append(','.join([
+                    start + ' +0000 UTC', end + ' +0000 UTC', str(hours),
+                    'tag', team, 'desc', creator + '@example.com',
+                ]))
+        return ('\n'.join(rows) + '\n').encode('utf-8')
+
+
+@pytest.fixture(params=['c', 'pyarrow'])
+def csv_engine(request, monkeypatch):
+    """run a test with each CSV engine"""
+    if request.param == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    monkeypatch.setattr(shoutbase.client, '_csv_engine',
+                        lambda: request.param)
+    return request.param
+
+
+@pytest.fixture
+def make_report(csv_engine):
+    """build a ShoutbaseReport talking to a FakeSession"""
+    def make(**session_kwargs):
+        report = ShoutbaseReport({'username': 'me', 'password': '123'})
+        report.session = FakeSession(**session_kwargs)
+        return report
+    return make
@@ -0,0 +1,24 @@
+PARAMS = {'team_name': 'T', 'start_date': '2018-01-01',
+          'end_date': '2018-01-20', 'tag_list': ['known', 'missing']}
+
+
+def tag_lookups(report):
+    return [url for url in report.session.calls if '/v1/tags' in url]
+
+
+def test_bulk_tag_lookup_does_not_requery_missing_names(make_report):
+    report = make_report(tags={'known': 'tag1'})
+
+    url = report.compose_report_url(PARAMS)
+
+    assert len(tag_lookups(report)) == 1
+    assert url.endswith('tagIds=tag1')
+
+
+def test_tag_lookup_falls_back_per_name_when_bulk_fails(make_report):
+    report = make_report(tags={'known': 'tag1'}, bulk_tags=False)
+
+    url = report.compose_report_url(PARAMS)
+
+    assert len(tag_lookups(report)) == 3  # bulk 404, then one per name
+    assert url.endswith('tagIds=tag1')
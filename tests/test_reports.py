@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+
+PARAMS = {'team_name': 'T', 'start_date': '2018-01-01',
+          'end_date': '2018-01-20'}
+
+
+def test_empty_export(make_report):
+    report = make_report(records=[])
+
+    assert report.total_hours_by_user(PARAMS).empty
+    assert report.hours_by_team(PARAMS).empty
+    report.refresh()
+    assert report.summary_by_week(PARAMS)['duration_hours'].sum() == 0
+
+
+def test_empty_export_chunked(make_report):
+    report = make_report(records=[])
+    report.chunksize = 2
+
+    assert report.total_hours_by_user(PARAMS).empty
+
+
+WEEK_PARAMS = {'team_name': 'T', 'start_date': '2024-1-3',
+               'end_date': '2024-1-20'}
+WEEK_RECORDS = [
+    # (start, end, hours, creator, team)
+    ('2024-01-02 23:00:00', '2024-01-03 01:00:00', 8, 'ann', 'T1'),
+    ('2024-01-03 09:00:00', '2024-01-03 10:00:00', 1, 'ann', 'T1'),
+    ('2024-01-07 23:00:00', '2024-01-08 01:00:00', 2, 'bob', 'T1'),
+    ('2024-01-08 00:00:00', '2024-01-08 03:00:00', 3, 'ann', 'T2'),
+    ('2024-01-14 22:00:00', '2024-01-15 00:00:00', 5, 'bob', 'T2'),
+    ('2024-01-15 00:00:00', '2024-01-15 01:30:00', 1.5, 'bob', 'T1'),
+    ('2024-01-19 10:00:00', '2024-01-19 14:00:00', 4, 'ann', 'T2'),
+    ('2024-01-19 22:00:00', '2024-01-20 02:00:00', 4, 'bob', 'T1'),
+]
+
+
+def test_split_by_week_unpadded_dates():
+    from shoutbase import ShoutbaseReport
+
+    weeks = ShoutbaseReport._split_by_week(WEEK_PARAMS)
+
+    assert [(week['start_date'], week['end_date'])
+            for week, _, _ in weeks] == [
+        ('2024-01-03', '2024-01-09'),
+        ('2024-01-08', '2024-01-16'),
+        ('2024-01-15', '2024-01-20'),
+    ]
+    assert weeks[0][1] is None and weeks[-1][2] is None
+
+
+@pytest.mark.parametrize('mode', ['start', 'contained', 'overlap'])
+def test_summary_by_week_matches_single_export(make_report, mode):
+    weekly = make_report(records=WEEK_RECORDS, mode=mode)
+    single = make_report(records=WEEK_RECORDS, mode=mode)
+    single.fetch(WEEK_PARAMS, usecols=single.report_columns)
+
+    weekly_summary = weekly.summary_by_week(WEEK_PARAMS)
+    exports = [url for url in weekly.session.calls if 'export' in url]
+
+    assert len(exports) == 3
+    pd.testing.assert_frame_equal(weekly_summary,
+                                  single.summary_by_week(WEEK_PARAMS))
+    pd.testing.assert_frame_equal(weekly.total_hours_by_user(WEEK_PARAMS),
+                                  single.total_hours_by_user(WEEK_PARAMS),
+                                  check_index_type=False)
+
+
+def test_summary_by_week_resolves_ids_once(make_report):
+    report = make_report(records=WEEK_RECORDS, tags={'known': 'tag1'})
+    params = dict(WEEK_PARAMS, tag_list=['known', 'missing'])
+
+    report.summary_by_week(params)
+    lookups = [url for url in report.session.calls if 'export' not in url]
+
+    assert len(lookups) == 2  # one team lookup, one bulk tag lookup